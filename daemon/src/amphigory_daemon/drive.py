@@ -23,7 +23,7 @@ class ScanStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class OpticalDrive:
     """
     Model representing an optical drive and its current state.
@@ -1,7 +1,9 @@
 """Main Amphigory daemon application - macOS menu bar app."""
 
 import asyncio
+import functools
 import logging
+import os
 import subprocess
 import webbrowser
 from dataclasses import dataclass
@@ -13,6 +15,12 @@ from typing import Optional
 import rumps
 import yaml
 
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 
 def get_git_sha() -> Optional[str]:
     """
@@ -94,6 +102,11 @@ DEFAULT_WEBAPP_URL = "http://localhost:6199"
 DEFAULT_WEBAPP_BASEDIR = "/opt/amphigory"
 WIKI_DOC_ROOT_URL = "https://gollum/amphigory"
 
+# Longest run_task_loop waits between checks while paused or idle. Local
+# changes wake it sooner; the webapp's tasks and PAUSED marker are only
+# seen on the next check.
+TASK_LOOP_POLL_SECONDS = 1
+
 
 def format_size(size_bytes: int) -> str:
     """Format bytes as human-readable size."""
@@ -135,6 +148,13 @@ def format_task_summary(response: TaskResponse) -> str:
     return "Unknown task type"
 
 
+@functools.lru_cache(maxsize=8)
+def _paused_marker_path(webapp_basedir: str) -> str:
+    """Path of the PAUSED marker under webapp_basedir, joined once per basedir."""
+    return os.path.join(webapp_basedir, "tasks", "PAUSED")
+
+
+@functools.cache
 def generate_daemon_id() -> str:
     """
     Generate a unique daemon ID based on username and hostname.
@@ -143,10 +163,12 @@ def generate_daemon_id() -> str:
     Adds :dev suffix when running from an interactive terminal (TTY),
     which indicates a development/debugging session.
 
+    The result is cached for the life of the process; call
+    generate_daemon_id.cache_clear() to recompute it.
+
     Returns:
         Daemon ID string
     """
-    import os
     import socket
     import sys
 
@@ -202,6 +224,9 @@ class AmphigoryDaemon(rumps.App):
         self._running = False
         self._task_loop: Optional[asyncio.Task] = None
         self._heartbeat_task: Optional[asyncio.Task] = None
+        # Set by run_task_loop; used to wake it early from any thread
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
 
         # Activity state
         self.activity_state = ActivityState.IDLE_EMPTY
@@ -266,6 +291,7 @@ class AmphigoryDaemon(rumps.App):
             self.pause_mode = PauseMode.AFTER_TRACK
             sender.title = "▶ Resume"
         self._update_overlays()
+        self._wake_task_loop()
 
     @rumps.clicked("Pause Now")
     def pause_now(self, sender):
@@ -273,6 +299,7 @@ class AmphigoryDaemon(rumps.App):
         self.pause_mode = PauseMode.IMMEDIATE
         self._create_paused_file()
         self._update_overlays()
+        self._wake_task_loop()
 
     def open_webapp(self, _):
         """Open webapp in browser."""
@@ -307,6 +334,7 @@ class AmphigoryDaemon(rumps.App):
         """Quit the application."""
         logger.info("Quit requested")
         self._running = False
+        self._wake_task_loop()
         if self._heartbeat_task:
             self._heartbeat_task.cancel()
         if self.ws_server:
@@ -356,24 +384,33 @@ class AmphigoryDaemon(rumps.App):
         """
         if not self.daemon_config:
             return False
-        paused_file = Path(self.daemon_config.webapp_basedir) / "tasks" / "PAUSED"
-        return paused_file.exists()
+        # Called on every task-loop tick, so skip Path and stat the cached string
+        return os.path.exists(_paused_marker_path(self.daemon_config.webapp_basedir))
 
     def _create_paused_file(self) -> None:
         """Create the PAUSED marker file in tasks directory."""
         if not self.daemon_config:
             return
-        paused_file = Path(self.daemon_config.webapp_basedir) / "tasks" / "PAUSED"
-        paused_file.parent.mkdir(parents=True, exist_ok=True)
-        paused_file.touch()
+        paused_file = _paused_marker_path(self.daemon_config.webapp_basedir)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC
+        try:
+            fd = os.open(paused_file, flags, 0o644)
+        except FileNotFoundError:
+            # tasks/ doesn't exist yet; only then pay for creating it
+            os.makedirs(os.path.dirname(paused_file), exist_ok=True)
+            fd = os.open(paused_file, flags, 0o644)
+        os.close(fd)
         logger.info(f"Created pause marker: {paused_file}")
 
     def _remove_paused_file(self) -> None:
         """Remove the PAUSED marker file from tasks directory."""
         if not self.daemon_config:
             return
-        paused_file = Path(self.daemon_config.webapp_basedir) / "tasks" / "PAUSED"
-        paused_file.unlink(missing_ok=True)
+        paused_file = _paused_marker_path(self.daemon_config.webapp_basedir)
+        try:
+            os.unlink(paused_file)
+        except FileNotFoundError:
+            pass
         logger.info(f"Removed pause marker: {paused_file}")
 
     def _update_icon(self) -> None:
@@ -607,6 +644,35 @@ class AmphigoryDaemon(rumps.App):
             logger.warning(f"Failed to run drutil: {e}")
             return "cd"
 
+    async def _fingerprint_disc(self, device: str, volume_name: str, disc_type: str) -> None:
+        """Generate the inserted disc's fingerprint and announce it.
+
+        generate_fingerprint_from_drutil blocks on a drutil subprocess, so it
+        runs in a worker thread to keep the event loop responsive.
+        """
+        try:
+            fingerprint = await asyncio.to_thread(
+                generate_fingerprint_from_drutil, disc_type, volume_name
+            )
+        except FingerprintError as e:
+            logger.warning(f"Failed to generate fingerprint: {e}")
+            return
+
+        # The disc may have been ejected or swapped while drutil ran
+        if not self.optical_drive or self.current_disc != (device, volume_name):
+            return
+
+        self.optical_drive.set_fingerprint(fingerprint)
+        logger.info(f"Generated fingerprint: {fingerprint[:16]}...")
+
+        # Send fingerprint event to webapp and local browsers
+        sends = []
+        if self.webapp_client and self.webapp_client.is_connected():
+            sends.append(self.webapp_client.send_fingerprint_event(fingerprint, device))
+        if self.ws_server:
+            sends.append(self.ws_server.send_fingerprint_event(fingerprint, device))
+        await asyncio.gather(*sends)
+
     def on_disc_insert(self, device: str, volume_name: str, volume_path: str) -> None:
         """Handle disc insertion."""
         logger.info(f"Disc inserted: {volume_name} at {device}, path: {volume_path}")
@@ -619,23 +685,8 @@ class AmphigoryDaemon(rumps.App):
             self.optical_drive.device = device
             self.optical_drive.insert_disc(volume=volume_name, disc_type=disc_type)
 
-            # Generate fingerprint using drutil (no filesystem access needed)
-            try:
-                fingerprint = generate_fingerprint_from_drutil(disc_type, volume_name)
-                self.optical_drive.set_fingerprint(fingerprint)
-                logger.info(f"Generated fingerprint: {fingerprint[:16]}...")
-
-                # Send fingerprint event to webapp and local browsers
-                if self.webapp_client and self.webapp_client.is_connected():
-                    asyncio.create_task(
-                        self.webapp_client.send_fingerprint_event(fingerprint, device)
-                    )
-                if self.ws_server:
-                    asyncio.create_task(
-                        self.ws_server.send_fingerprint_event(fingerprint, device)
-                    )
-            except FingerprintError as e:
-                logger.warning(f"Failed to generate fingerprint: {e}")
+            # Fingerprint in the background; drutil can take seconds to answer
+            asyncio.create_task(self._fingerprint_disc(device, volume_name, disc_type))
 
         self.current_disc = (device, volume_name)
         self.activity_state = ActivityState.IDLE_DISC
@@ -682,6 +733,10 @@ class AmphigoryDaemon(rumps.App):
         self,
         config_file: Optional[Path] = None,
         cache_file: Optional[Path] = None,
+        *,
+        task_queue_cls: Optional[type] = None,
+        ws_server_cls: Optional[type] = None,
+        webapp_client_cls: Optional[type] = None,
     ) -> bool:
         """
         Initialize the daemon.
@@ -689,6 +744,9 @@ class AmphigoryDaemon(rumps.App):
         Args:
             config_file: Path to daemon.yaml (defaults to LOCAL_CONFIG_FILE)
             cache_file: Path to cached_config.json (defaults to CACHED_CONFIG_FILE)
+            task_queue_cls: TaskQueue factory (defaults to TaskQueue)
+            ws_server_cls: WebSocket server factory (defaults to WebSocketServer)
+            webapp_client_cls: Webapp client factory (defaults to WebAppClient)
 
         Returns:
             True if initialization successful
@@ -697,6 +755,12 @@ class AmphigoryDaemon(rumps.App):
             config_file = LOCAL_CONFIG_FILE
         if cache_file is None:
             cache_file = CACHED_CONFIG_FILE
+        if task_queue_cls is None:
+            task_queue_cls = TaskQueue
+        if ws_server_cls is None:
+            ws_server_cls = WebSocketServer
+        if webapp_client_cls is None:
+            webapp_client_cls = WebAppClient
 
         try:
             # Log the effective logging level
@@ -761,13 +825,13 @@ class AmphigoryDaemon(rumps.App):
 
             # Initialize task queue
             tasks_dir = Path(self.daemon_config.webapp_basedir) / self.webapp_config.tasks_directory.lstrip("/")
-            self.task_queue = TaskQueue(tasks_dir)
+            self.task_queue = task_queue_cls(tasks_dir)
             self.task_queue.ensure_directories()
             self.task_queue.recover_crashed_tasks()
             logger.info(f"Task queue initialized at {tasks_dir}")
 
             # Initialize WebSocket server (for browser connections)
-            self.ws_server = WebSocketServer(
+            self.ws_server = ws_server_cls(
                 port=self.webapp_config.websocket_port,
                 heartbeat_interval=self.webapp_config.heartbeat_interval,
             )
@@ -777,7 +841,7 @@ class AmphigoryDaemon(rumps.App):
 
             # Connect to webapp's WebSocket endpoint with auto-reconnect
             webapp_ws_url = f"{self.daemon_config.webapp_url.replace('http', 'ws')}/ws"
-            self.webapp_client = WebAppClient(webapp_ws_url)
+            self.webapp_client = webapp_client_cls(webapp_ws_url)
 
             # Register request handlers
             self.webapp_client.on_request("get_drive_status", self._handle_get_drive_status)
@@ -819,21 +883,46 @@ class AmphigoryDaemon(rumps.App):
             logger.error(f"Initialization failed: {e}")
             return False
 
+    def _wake_task_loop(self) -> None:
+        """
+        Wake run_task_loop if it is waiting between checks.
+
+        Safe to call from the rumps (AppKit) thread; does nothing if the
+        loop hasn't started or its event loop has closed.
+        """
+        if self._wake is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wake.set)
+        except RuntimeError:
+            # The loop closed after run_task_loop returned; nothing to wake
+            pass
+
+    async def _wait_for_wake(self) -> None:
+        """Wait until woken or TASK_LOOP_POLL_SECONDS pass, whichever is first."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), TASK_LOOP_POLL_SECONDS)
+        except TimeoutError:
+            pass
+        self._wake.clear()
+
     async def run_task_loop(self) -> None:
         """Main task processing loop."""
         self._running = True
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
 
         while self._running:
             try:
                 # Check filesystem pause marker (source of truth, shared with webapp)
                 if self.is_queue_paused():
-                    await asyncio.sleep(1)
+                    await self._wait_for_wake()
                     continue
 
                 # Get next task
                 task = self.task_queue.get_next_task()
                 if not task:
-                    await asyncio.sleep(1)
+                    await self._wait_for_wake()
                     continue
 
                 # Process task
@@ -1091,7 +1180,10 @@ def main():
     import time
 
     def run_async():
-        asyncio.run(async_main())
+        # Use libuv's event loop when uvloop is installed (the "fast" extra)
+        loop_factory = uvloop.new_event_loop if HAS_UVLOOP else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(async_main())
 
     thread = threading.Thread(target=run_async, daemon=True)
     thread.start()
@@ -0,0 +1,325 @@
+"""Shared pytest fixtures for daemon tests."""
+
+import copy
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, Mock, create_autospec, patch
+
+import pytest
+
+
+# Module-level functions that AmphigoryDaemon.initialize() calls on amphigory_daemon.main
+DAEMON_PATCH_TARGETS = (
+    "fetch_webapp_config",
+    "get_config",
+    "validate_config",
+    "discover_makemkvcon",
+)
+
+# Targets that are coroutine functions and need an AsyncMock
+ASYNC_PATCH_TARGETS = frozenset({"fetch_webapp_config", "get_config"})
+
+# The makemkvcon path daemon_patches reports; test modules import it rather than repeat it
+MAKEMKVCON_PATH = Path("/usr/bin/makemkvcon")
+
+# Default return values shared by every daemon_patches instance
+DEFAULT_PATCH_RETURN_VALUES = {
+    "discover_makemkvcon": MAKEMKVCON_PATH,
+}
+
+
+def _mock_ws_server():
+    """A new autospec'd WebSocketServer instance with no config-change callback."""
+    from amphigory_daemon.websocket import WebSocketServer
+
+    server = create_autospec(WebSocketServer, instance=True)
+    server.on_config_change = None
+    return server
+
+
+def _mock_webapp_client():
+    """A new autospec'd WebAppClient instance."""
+    from amphigory_daemon.websocket import WebAppClient
+
+    return create_autospec(WebAppClient, instance=True)
+
+
+@contextmanager
+def _patched_daemon_collaborators():
+    """Apply the daemon_patches patches and yield the namespace it describes."""
+    from amphigory_daemon import main
+    from amphigory_daemon.config import ConfigValidationResult
+    from amphigory_daemon.tasks import TaskQueue
+
+    mocks = {
+        name: AsyncMock() if name in ASYNC_PATCH_TARGETS else MagicMock()
+        for name in DAEMON_PATCH_TARGETS
+    }
+    for name, value in DEFAULT_PATCH_RETURN_VALUES.items():
+        mocks[name].return_value = value
+    mocks["validate_config"].return_value = ConfigValidationResult(
+        makemkvcon_valid=True,
+        makemkvcon_error=None,
+        basedir_valid=True,
+        basedir_error=None,
+    )
+
+    with patch.multiple(main, **mocks):
+        ws_server = _mock_ws_server()
+        webapp_client = _mock_webapp_client()
+        # Plain Mocks: the classes are only called, never used as containers
+        classes = {
+            "TaskQueue": Mock(return_value=Mock(spec=TaskQueue)),
+            "WebSocketServer": Mock(return_value=ws_server),
+            "WebAppClient": Mock(return_value=webapp_client),
+        }
+
+        yield SimpleNamespace(
+            ws_server=ws_server,
+            webapp_client=webapp_client,
+            initialize_kwargs={
+                "task_queue_cls": classes["TaskQueue"],
+                "ws_server_cls": classes["WebSocketServer"],
+                "webapp_client_cls": classes["WebAppClient"],
+            },
+            **classes,
+            **mocks,
+        )
+
+
+@pytest.fixture
+def daemon_patches():
+    """
+    Patch the functions initialize() calls and build its collaborator mocks.
+
+    Yields a namespace holding each patched function (e.g. ``get_config``),
+    mock ``TaskQueue``/``WebSocketServer``/``WebAppClient`` classes, the
+    instances those classes return (``ws_server``, ``webapp_client``), and
+    ``initialize_kwargs`` for injecting the classes:
+    ``await daemon.initialize(config_file, cache_file, **daemon_patches.initialize_kwargs)``.
+    validate_config reports a valid config by default; tests set
+    ``get_config.return_value`` and override anything else they care about.
+
+    The server and client are built with create_autospec for each use, so
+    their async methods are AsyncMocks and no calls or return values carry
+    over from other tests.
+    """
+    with _patched_daemon_collaborators() as patches:
+        yield patches
+
+
+@pytest.fixture(scope="class")
+def class_daemon_patches():
+    """daemon_patches held in place for a whole test class."""
+    with _patched_daemon_collaborators() as patches:
+        yield patches
+
+
+@pytest.fixture
+def webapp_client():
+    """An autospec'd WebAppClient for this test only, reporting itself connected."""
+    client = _mock_webapp_client()
+    client.is_connected.return_value = True
+    return client
+
+
+@pytest.fixture
+def ws_server():
+    """An autospec'd WebSocketServer for this test only."""
+    return _mock_ws_server()
+
+
+@pytest.fixture(scope="session")
+def _daemon_template():
+    """A single AmphigoryDaemon built once per session and never mutated."""
+    from amphigory_daemon.main import AmphigoryDaemon
+
+    return AmphigoryDaemon()
+
+
+@pytest.fixture
+def daemon(_daemon_template):
+    """
+    Fresh AmphigoryDaemon for a single test, copied from the session template.
+
+    Attribute assignments on the copy don't reach the template, and the
+    status_overlays set is replaced so in-place changes don't either. Menu
+    items are shared with the template, so tests that call anything which
+    updates the menu (the disc and pause handlers, cold-start mode,
+    initialize) or assert on menu titles or callbacks must build their own
+    daemon.
+    """
+    daemon = copy.copy(_daemon_template)
+    daemon.status_overlays = set(_daemon_template.status_overlays)
+    return daemon
+
+
+@pytest.fixture(scope="session")
+def _daemon_yaml_bytes():
+    """daemon.yaml contents serialized once, with a placeholder basedir."""
+    import yaml
+
+    return yaml.dump({
+        "webapp_url": "http://localhost:6199",
+        "webapp_basedir": "__BASEDIR__",
+    }).encode()
+
+
+@pytest.fixture
+def config_file(tmp_path, _daemon_yaml_bytes):
+    """A daemon.yaml in tmp_path whose webapp_basedir is tmp_path itself."""
+    config_file = tmp_path / "daemon.yaml"
+    config_file.write_bytes(
+        _daemon_yaml_bytes.replace(b"__BASEDIR__", str(tmp_path).encode())
+    )
+    return config_file
+
+
+@pytest.fixture
+def created_tasks(monkeypatch):
+    """
+    Record every task started with asyncio.create_task during the test.
+
+    Lets tests await fire-and-forget work (``await asyncio.gather(*created_tasks)``)
+    instead of sleeping and hoping it has finished.
+    """
+    import asyncio
+
+    tasks = []
+    real_create_task = asyncio.create_task
+
+    def recording_create_task(coro, **kwargs):
+        task = real_create_task(coro, **kwargs)
+        tasks.append(task)
+        return task
+
+    monkeypatch.setattr(asyncio, "create_task", recording_create_task)
+    return tasks
+
+
+@pytest.fixture
+async def cancel_leftover_tasks():
+    """
+    Cancel tasks a test leaves running on the shared session event loop.
+
+    Fire-and-forget tasks (heartbeat loops, disc events) would otherwise keep
+    running into later tests now that every test shares one loop.
+    """
+    import asyncio
+
+    before = asyncio.all_tasks()
+    yield
+    leftover = asyncio.all_tasks() - before - {asyncio.current_task()}
+    for task in leftover:
+        task.cancel()
+    await asyncio.gather(*leftover, return_exceptions=True)
+
+
+@pytest.fixture(scope="class")
+def _drive_template():
+    """An empty OpticalDrive on /dev/rdisk4, built once per test class."""
+    from amphigory_daemon.drive import OpticalDrive
+
+    return OpticalDrive(daemon_id="test@host", device="/dev/rdisk4")
+
+
+@pytest.fixture
+def drive(_drive_template):
+    """A fresh copy of the class's OpticalDrive template."""
+    return copy.copy(_drive_template)
+
+
+@pytest.fixture
+def stub_disc_type(monkeypatch):
+    """Make AmphigoryDaemon._detect_disc_type report a DVD without running drutil."""
+    from amphigory_daemon.main import AmphigoryDaemon
+
+    monkeypatch.setattr(AmphigoryDaemon, "_detect_disc_type", lambda self: "dvd")
+
+
+@pytest.fixture
+def stub_fingerprint(monkeypatch):
+    """
+    Make on_disc_insert's fingerprinting return a canned value without running drutil.
+
+    Returns the fingerprint the daemon will report.
+    """
+    from amphigory_daemon import main
+
+    fingerprint = "dvd-0123456789abcdef"
+    monkeypatch.setattr(
+        main, "generate_fingerprint_from_drutil", lambda disc_type, volume_name=None: fingerprint
+    )
+    return fingerprint
+
+
+@pytest.fixture(scope="session")
+def sample_tracks():
+    """A main feature and a short extra, built once per session. Treat as read-only."""
+    from amphigory_daemon.models import ScannedTrack
+
+    return (
+        ScannedTrack(number=0, duration="2:00:00", size_bytes=25_000_000_000,
+                     chapters=20, resolution="1920x1080", audio_streams=[], subtitle_streams=[]),
+        ScannedTrack(number=1, duration="0:05:00", size_bytes=500_000_000,
+                     chapters=1, resolution="1920x1080", audio_streams=[], subtitle_streams=[]),
+    )
+
+
+@pytest.fixture
+def scan_task_response(sample_tracks):
+    """A successful scan TaskResponse for TEST_MOVIE with the two sample tracks."""
+    from datetime import datetime
+
+    from amphigory_daemon.models import ScanResult, TaskResponse, TaskStatus
+
+    return TaskResponse(
+        task_id="test-scan",
+        status=TaskStatus.SUCCESS,
+        started_at=datetime.now(),
+        completed_at=datetime.now(),
+        duration_seconds=45,
+        result=ScanResult(disc_name="TEST_MOVIE", disc_type="bluray", tracks=list(sample_tracks)),
+    )
+
+
+@pytest.fixture
+def rip_task_response():
+    """A successful rip TaskResponse for a 25 GB file ripped in 600s."""
+    from datetime import datetime
+
+    from amphigory_daemon.models import FileDestination, RipResult, TaskResponse, TaskStatus
+
+    return TaskResponse(
+        task_id="test-rip",
+        status=TaskStatus.SUCCESS,
+        started_at=datetime.now(),
+        completed_at=datetime.now(),
+        duration_seconds=600,  # 10 minutes
+        result=RipResult(
+            destination=FileDestination(
+                directory="/data/ripped",
+                filename="Movie (2024).mkv",
+                size_bytes=25 * 1024 ** 3,  # 25 GB
+            )
+        ),
+    )
+
+
+@pytest.fixture
+def failed_task_response():
+    """A failed TaskResponse carrying a MAKEMKV_FAILED error."""
+    from datetime import datetime
+
+    from amphigory_daemon.models import ErrorCode, TaskError, TaskResponse, TaskStatus
+
+    return TaskResponse(
+        task_id="test-fail",
+        status=TaskStatus.FAILED,
+        started_at=datetime.now(),
+        completed_at=datetime.now(),
+        duration_seconds=5,
+        error=TaskError(code=ErrorCode.MAKEMKV_FAILED, message="Disc unreadable"),
+    )
+
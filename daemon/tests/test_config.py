@@ -1,8 +1,6 @@
 """Tests for configuration management - TDD: tests written first."""
 
 import json
-import tempfile
-from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -218,7 +216,6 @@ class TestSaveLocalConfig:
 
 
 class TestFetchWebappConfig:
-    @pytest.mark.asyncio
     async def test_fetches_config_from_webapp(self):
         """Fetch and parse config from webapp's /config.json endpoint."""
         from amphigory_daemon.config import fetch_webapp_config
@@ -249,7 +246,6 @@ class TestFetchWebappConfig:
         assert config.tasks_directory == "/tasks"
         assert config.websocket_port == 9847
 
-    @pytest.mark.asyncio
     async def test_raises_on_connection_error(self):
         """Raise ConnectionError when webapp is unreachable."""
         from amphigory_daemon.config import fetch_webapp_config
@@ -320,7 +316,6 @@ class TestLoadCachedConfig:
 
 
 class TestGetConfig:
-    @pytest.mark.asyncio
     async def test_fetches_from_webapp_and_caches(self, tmp_path):
         """Fetch config from webapp and cache it."""
         from amphigory_daemon.config import get_config
@@ -364,7 +359,6 @@ class TestGetConfig:
         assert webapp_config.tasks_directory == "/tasks"
         assert cache_file.exists()
 
-    @pytest.mark.asyncio
     async def test_falls_back_to_cache_when_webapp_unreachable(self, tmp_path):
         """Use cached config when webapp is offline."""
         from amphigory_daemon.config import get_config
@@ -399,7 +393,6 @@ class TestGetConfig:
 
         assert webapp_config.tasks_directory == "/tasks"
 
-    @pytest.mark.asyncio
     async def test_raises_when_no_webapp_and_no_cache(self, tmp_path):
         """Raise error when webapp unreachable and no cache exists."""
         from amphigory_daemon.config import get_config
@@ -4,12 +4,10 @@ import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock
 
-import pytest
 import websockets
 
 
 class TestWebSocketServer:
-    @pytest.mark.asyncio
     async def test_server_starts_and_accepts_connection(self):
         """Server starts and accepts WebSocket connections."""
         from amphigory_daemon.websocket import WebSocketServer
@@ -24,7 +22,6 @@ class TestWebSocketServer:
         finally:
             await server.stop()
 
-    @pytest.mark.asyncio
     async def test_broadcast_sends_to_all_clients(self):
         """Broadcast sends message to all connected clients."""
         from amphigory_daemon.websocket import WebSocketServer
@@ -49,7 +46,6 @@ class TestWebSocketServer:
         finally:
             await server.stop()
 
-    @pytest.mark.asyncio
     async def test_has_clients_returns_correct_state(self):
         """has_clients() returns True when clients connected."""
         from amphigory_daemon.websocket import WebSocketServer
@@ -71,7 +67,6 @@ class TestWebSocketServer:
 
 
 class TestWebSocketMessages:
-    @pytest.mark.asyncio
     async def test_send_progress(self):
         """send_progress broadcasts progress update."""
         from amphigory_daemon.websocket import WebSocketServer
@@ -101,7 +96,6 @@ class TestWebSocketMessages:
         finally:
             await server.stop()
 
-    @pytest.mark.asyncio
     async def test_send_disc_event(self):
         """send_disc_event broadcasts disc inserted/ejected."""
         from amphigory_daemon.websocket import WebSocketServer
@@ -129,7 +123,6 @@ class TestWebSocketMessages:
         finally:
             await server.stop()
 
-    @pytest.mark.asyncio
     async def test_send_fingerprint_event(self):
         """send_fingerprint_event broadcasts fingerprint generated event."""
         from amphigory_daemon.websocket import WebSocketServer
@@ -156,7 +149,6 @@ class TestWebSocketMessages:
         finally:
             await server.stop()
 
-    @pytest.mark.asyncio
     async def test_send_heartbeat(self):
         """send_heartbeat broadcasts daemon status."""
         from amphigory_daemon.websocket import WebSocketServer
@@ -184,7 +176,6 @@ class TestWebSocketMessages:
         finally:
             await server.stop()
 
-    @pytest.mark.asyncio
     async def test_send_sync(self):
         """send_sync broadcasts full state on reconnect."""
         from amphigory_daemon.websocket import WebSocketServer
@@ -225,7 +216,6 @@ class TestWebSocketMessages:
 class TestWebSocketConfigSync:
     """Tests for daemon/webapp config synchronization."""
 
-    @pytest.mark.asyncio
     async def test_send_daemon_config(self):
         """send_daemon_config broadcasts daemon configuration."""
         from amphigory_daemon.websocket import WebSocketServer
@@ -253,7 +243,6 @@ class TestWebSocketConfigSync:
         finally:
             await server.stop()
 
-    @pytest.mark.asyncio
     async def test_on_config_change_callback(self):
         """Server calls on_config_change when webapp_config_changed received."""
         from amphigory_daemon.websocket import WebSocketServer
@@ -279,7 +268,6 @@ class TestWebSocketConfigSync:
         finally:
             await server.stop()
 
-    @pytest.mark.asyncio
     async def test_on_config_change_not_called_for_other_messages(self):
         """on_config_change not called for non-config messages."""
         from amphigory_daemon.websocket import WebSocketServer
@@ -304,7 +292,6 @@ class TestWebSocketConfigSync:
         finally:
             await server.stop()
 
-    @pytest.mark.asyncio
     async def test_send_daemon_config_includes_timestamp(self):
         """send_daemon_config includes timestamp."""
         from amphigory_daemon.websocket import WebSocketServer
@@ -333,7 +320,6 @@ class TestWebSocketConfigSync:
 class TestWebAppClient:
     """Tests for WebSocket client connecting to webapp."""
 
-    @pytest.mark.asyncio
     async def test_client_connects_to_webapp(self):
         """WebAppClient connects to webapp WebSocket endpoint."""
         from amphigory_daemon.websocket import WebAppClient
@@ -354,7 +340,6 @@ class TestWebAppClient:
             finally:
                 await client.disconnect()
 
-    @pytest.mark.asyncio
     async def test_client_sends_daemon_config_on_connect(self):
         """WebAppClient sends daemon_config message on connect."""
         from amphigory_daemon.websocket import WebAppClient
@@ -386,7 +371,6 @@ class TestWebAppClient:
             finally:
                 await client.disconnect()
 
-    @pytest.mark.asyncio
     async def test_client_sends_heartbeat(self):
         """WebAppClient can send heartbeat messages."""
         from amphigory_daemon.websocket import WebAppClient
@@ -410,7 +394,6 @@ class TestWebAppClient:
             finally:
                 await client.disconnect()
 
-    @pytest.mark.asyncio
     async def test_client_handles_disconnect(self):
         """WebAppClient handles server disconnect gracefully."""
         from amphigory_daemon.websocket import WebAppClient
@@ -438,7 +421,6 @@ class TestWebAppClient:
 class TestHeartbeatLoop:
     """Tests for the heartbeat loop functionality."""
 
-    @pytest.mark.asyncio
     async def test_start_heartbeat_loop_sends_periodic_heartbeats(self):
         """start_heartbeat_loop sends heartbeats at configured interval."""
         from amphigory_daemon.websocket import WebAppClient
@@ -471,7 +453,6 @@ class TestHeartbeatLoop:
         heartbeats = [m for m in received_messages if m.get("type") == "heartbeat"]
         assert len(heartbeats) >= 2
 
-    @pytest.mark.asyncio
     async def test_heartbeat_loop_stops_on_disconnect(self):
         """Heartbeat loop stops gracefully when disconnected."""
         from amphigory_daemon.websocket import WebAppClient
@@ -506,7 +487,6 @@ class TestHeartbeatLoop:
             # Loop should have exited (not hang indefinitely)
             assert loop_task.done() or loop_task.cancelled()
 
-    @pytest.mark.asyncio
     async def test_heartbeat_loop_is_cancellable(self):
         """Heartbeat loop can be cancelled cleanly."""
         from amphigory_daemon.websocket import WebAppClient
@@ -539,7 +519,6 @@ class TestHeartbeatLoop:
 class TestWebAppClientRequestHandling:
     """Tests for handling requests from webapp."""
 
-    @pytest.mark.asyncio
     async def test_registers_request_handler(self):
         """Can register a handler for incoming requests."""
         from amphigory_daemon.websocket import WebAppClient
@@ -551,7 +530,6 @@ class TestWebAppClientRequestHandling:
 
         assert "get_drive_status" in client._request_handlers
 
-    @pytest.mark.asyncio
     async def test_handles_request_and_sends_response(self):
         """Handles request message and sends response."""
         from amphigory_daemon.websocket import WebAppClient
@@ -583,7 +561,6 @@ class TestWebAppClientRequestHandling:
         assert response["request_id"] == "req-123"
         assert response["result"]["drive_id"] == "test:rdisk0"
 
-    @pytest.mark.asyncio
     async def test_handles_unknown_method(self):
         """Sends error response for unknown method."""
         from amphigory_daemon.websocket import WebAppClient
@@ -608,7 +585,6 @@ class TestWebAppClientRequestHandling:
         assert response["request_id"] == "req-456"
         assert "error" in response
 
-    @pytest.mark.asyncio
     async def test_handles_handler_exception(self):
         """Sends error response if handler raises exception."""
         from amphigory_daemon.websocket import WebAppClient